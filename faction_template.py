@@ -4,13 +4,24 @@ Faction Tracking Template for reMarkable 2
 Based on the Game Master's Handbook of Proactive Roleplaying
 """
 
+import argparse
+import io
+import os
+from functools import lru_cache
+
 from reportlab.lib.units import mm
 from reportlab.lib.colors import Color, black, white
 from reportlab.pdfgen import canvas
+from reportlab.pdfgen.pdfgeom import bezierArc
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.lib.pagesizes import letter
 
+try:
+    import pikepdf
+except ImportError:  # optional, only used to repack the output more tightly
+    pikepdf = None
+
 # reMarkable 2 native resolution: 1404 x 1872 pixels at 226 DPI
 RM2_WIDTH = 1404 * 72 / 226  # ~446.5 points
 RM2_HEIGHT = 1872 * 72 / 226  # ~595.6 points
@@ -24,30 +35,82 @@ DARK_GRAY = Color(0.3, 0.3, 0.3)
 MARGIN = 20
 LINE_HEIGHT = 14
 SMALL_LINE_HEIGHT = 12
+FLOURISH_SIZE = 8
+
+# Page layout
+CONTENT_WIDTH = RM2_WIDTH - 2 * MARGIN
+RESOURCE_COL_WIDTH = (CONTENT_WIDTH - 10) / 2
+RELATION_COL_WIDTH = (CONTENT_WIDTH - 20) / 2
+HALF_COL_WIDTH = (CONTENT_WIDTH - 15) / 2
+
+# Scale labels
+PROGRESS_LABELS = ("Nascent", "Emerging", "Advancing", "Imminent", "Complete")
+DISPOSITION_LABELS = ("Hostile", "Wary", "Neutral", "Friendly", "Allied")
+
+# Resource trackers as rows of (left column, right column), with the label
+# x and first box x of each column
+RESOURCE_ROWS = [("Troops:", "Magic:"), ("Money:", "Influence:")]
+BOX_SIZE = 10
+BOX_SPACING = 3
+LABEL_WIDTH_MAX = 55
+RESOURCE_COLUMNS = (
+    (MARGIN + 10, MARGIN + LABEL_WIDTH_MAX),
+    (MARGIN + RESOURCE_COL_WIDTH + 10, MARGIN + RESOURCE_COL_WIDTH + LABEL_WIDTH_MAX - 5),
+)
+
+# Corner flourishes, relative to their corner: the x/y direction of the two
+# arms, the start angle of the quarter arc joining them, and that arc's
+# Bezier control points
+_FLOURISH_ARMS = {"tl": (1, -1), "tr": (-1, -1), "bl": (1, 1), "br": (-1, 1)}
+_FLOURISH_ARC_START = {"tl": 90, "tr": 0, "bl": 180, "br": 270}
+_FLOURISH_BEZIER = {
+    position: bezierArc(min(0, dx * FLOURISH_SIZE), min(0, dy * FLOURISH_SIZE),
+                        max(0, dx * FLOURISH_SIZE), max(0, dy * FLOURISH_SIZE),
+                        _FLOURISH_ARC_START[position], 90)[0]
+    for position, (dx, dy) in _FLOURISH_ARMS.items()
+}
+
+# Helvetica 8 widths of the scale labels, measured on first use
+_label_widths = {}
+
+
+def _get_label_widths():
+    """Return the cached widths of every progress and disposition label."""
+    if not _label_widths:
+        for label in PROGRESS_LABELS + DISPOSITION_LABELS:
+            _label_widths[label] = pdfmetrics.stringWidth(label, "Helvetica", 8)
+    return _label_widths
+
+
+class _FontCache:
+    """Remember the font last set in a content stream and skip repeats of it."""
+    
+    def __init__(self):
+        self.current = None
+    
+    def set(self, c, name, size):
+        if (name, size) != self.current:
+            c.setFont(name, size)
+            self.current = (name, size)
 
 
 def draw_corner_flourish(c, x, y, position):
     """Draw a small Celtic-style corner flourish."""
+    size = FLOURISH_SIZE
+    dx, dy = _FLOURISH_ARMS[position]
+    x0, y0, x1, y1, x2, y2, x3, y3 = _FLOURISH_BEZIER[position]
+    
+    p = c.beginPath()
+    p.moveTo(x, y)
+    p.lineTo(x + dx * size, y)
+    p.moveTo(x, y)
+    p.lineTo(x, y + dy * size)
+    p.moveTo(x + x0, y + y0)
+    p.curveTo(x + x1, y + y1, x + x2, y + y2, x + x3, y + y3)
+    
     c.setStrokeColor(MED_GRAY)
     c.setLineWidth(0.75)
-    size = 8
-    
-    if position == "tl":
-        c.line(x, y, x + size, y)
-        c.line(x, y, x, y - size)
-        c.arc(x, y - size, x + size, y, 90, 90)
-    elif position == "tr":
-        c.line(x, y, x - size, y)
-        c.line(x, y, x, y - size)
-        c.arc(x - size, y - size, x, y, 0, 90)
-    elif position == "bl":
-        c.line(x, y, x + size, y)
-        c.line(x, y, x, y + size)
-        c.arc(x, y, x + size, y + size, 180, 90)
-    elif position == "br":
-        c.line(x, y, x - size, y)
-        c.line(x, y, x, y + size)
-        c.arc(x - size, y, x, y + size, 270, 90)
+    c.drawPath(p, stroke=1, fill=0)
 
 
 def draw_decorative_frame(c, x, y, width, height):
@@ -62,9 +125,10 @@ def draw_decorative_frame(c, x, y, width, height):
     draw_corner_flourish(c, x + width, y - height, "br")
 
 
-def draw_section_header(c, x, y, width, title):
+def draw_section_header(c, x, y, width, title, fonts=None):
     """Draw a decorated section header."""
-    c.setFont("Helvetica-Bold", 11)
+    fonts = fonts or _FontCache()
+    fonts.set(c, "Helvetica-Bold", 11)
     c.setFillColor(DARK_GRAY)
     c.drawString(x + 12, y, title)
     
@@ -80,14 +144,15 @@ def draw_section_header(c, x, y, width, title):
 
 def draw_ruled_lines(c, x, y, width, num_lines, line_height=SMALL_LINE_HEIGHT):
     """Draw light gray ruled lines for writing."""
-    c.setStrokeColor(LIGHT_GRAY)
-    c.setLineWidth(0.5)
-    c.setDash([2, 2])
-    
+    lines = []
     for i in range(num_lines):
         line_y = y - (i * line_height)
-        c.line(x, line_y, x + width, line_y)
+        lines.append((x, line_y, x + width, line_y))
     
+    c.setStrokeColor(LIGHT_GRAY)
+    c.setLineWidth(0.5)
+    c.setDash([2, 2])
+    c.lines(lines)
     c.setDash([])
     return y - (num_lines * line_height)
 
@@ -99,338 +164,418 @@ def draw_sword_divider(c, x, y, width):
     
     mid = x + width / 2
     
-    c.line(x + 20, y, mid - 15, y)
-    c.line(mid + 15, y, x + width - 20, y)
-    
-    c.line(mid - 12, y, mid + 12, y)
-    c.line(mid - 3, y - 3, mid - 3, y + 3)
-    c.line(mid + 3, y - 3, mid + 3, y + 3)
-    c.circle(mid, y, 2, fill=0)
+    c.lines([
+        (x + 20, y, mid - 15, y),
+        (mid + 15, y, x + width - 20, y),
+        (mid - 12, y, mid + 12, y),  # Blade
+        (mid - 3, y - 3, mid - 3, y + 3),  # Guard
+        (mid + 3, y - 3, mid + 3, y + 3),  # Guard
+    ])
+    c.circle(mid, y, 2, fill=0)  # Pommel hint
+
 
+def draw_strings(c, strings):
+    """Draw (x, y, text) strings in the current font and fill as one text object."""
+    t = c.beginText()
+    for x, y, text in strings:
+        t.setTextOrigin(x, y)
+        t.textOut(text)
+    c.drawText(t)
 
-def draw_field_with_label(c, x, y, label, line_start, line_end):
-    """Draw a labeled field with underline."""
-    c.setFont("Helvetica", 9)
+
+def draw_field_with_label(c, x, y, label, line_start, line_end, fonts=None):
+    """Draw a labeled field with underline (dashed if the caller has set a dash)."""
+    fonts = fonts or _FontCache()
+    fonts.set(c, "Helvetica", 9)
     c.setFillColor(MED_GRAY)
     c.drawString(x, y, label)
     c.setStrokeColor(LIGHT_GRAY)
     c.setLineWidth(0.5)
-    c.setDash([2, 2])
     c.line(line_start, y - 3, line_end, y - 3)
-    c.setDash([])
 
 
-def draw_progress_clock(c, x, y, width):
-    """Draw a progress track as a horizontal scale (matching disposition style)."""
-    scale_width = width - 20
-    start_x = x + 10
+@lru_cache(maxsize=None)
+def _scale_ticks(num_labels, minor_ticks=3):
+    """Return the major and minor tick positions as fractions of a scale's width."""
+    segments = num_labels - 1
+    major = tuple(i / segments for i in range(num_labels))
+    minor = tuple((i + j / (minor_ticks + 1)) / segments
+                  for i in range(segments)
+                  for j in range(1, minor_ticks + 1))
+    return major, minor
+
+
+def _draw_scale_rule(c, start_x, y, scale_width, num_labels):
+    """Draw a scale's rule and tick marks."""
+    major_ticks, minor_ticks = _scale_ticks(num_labels)
     
-    labels = ["Nascent", "Emerging", "Advancing", "Imminent", "Complete"]
-    num_labels = len(labels)
-    segment_width = scale_width / (num_labels - 1)
+    # Rule and major ticks share one stroke, minor ticks another
+    major = [(start_x, y, start_x + scale_width, y)]
+    major.extend((start_x + tick * scale_width, y - 5, start_x + tick * scale_width, y + 5)
+                 for tick in major_ticks)
+    minor = [(start_x + tick * scale_width, y - 3, start_x + tick * scale_width, y + 3)
+             for tick in minor_ticks]
     
     c.setStrokeColor(MED_GRAY)
     c.setLineWidth(1)
-    c.line(start_x, y, start_x + scale_width, y)
-    
-    c.setFont("Helvetica", 8)
-    c.setFillColor(MED_GRAY)
-    
-    for i, label in enumerate(labels):
-        tick_x = start_x + i * segment_width
-        c.line(tick_x, y - 5, tick_x, y + 5)
-        
-        label_width = c.stringWidth(label, "Helvetica", 8)
-        c.drawString(tick_x - label_width/2, y - 16, label)
+    c.lines(major)
     
     c.setStrokeColor(LIGHT_GRAY)
     c.setLineWidth(0.5)
-    minor_ticks = 3
-    for i in range(num_labels - 1):
-        for j in range(1, minor_ticks + 1):
-            tick_x = start_x + i * segment_width + j * (segment_width / (minor_ticks + 1))
-            c.line(tick_x, y - 3, tick_x, y + 3)
+    c.lines(minor)
 
 
-def draw_disposition_scale(c, x, y, width):
-    """Draw a horizontal disposition scale with tick marks."""
+def draw_labeled_scale(c, x, y, width, labels, fonts=None):
+    """Draw a horizontal scale with a labeled major tick for each entry in labels."""
+    fonts = fonts or _FontCache()
     scale_width = width - 20
     start_x = x + 10
     
-    labels = ["Hostile", "Wary", "Neutral", "Friendly", "Allied"]
     num_labels = len(labels)
-    segment_width = scale_width / (num_labels - 1)
+    major_ticks, _ = _scale_ticks(num_labels)
     
-    c.setStrokeColor(MED_GRAY)
-    c.setLineWidth(1)
-    c.line(start_x, y, start_x + scale_width, y)
+    _draw_scale_rule(c, start_x, y, scale_width, num_labels)
     
-    c.setFont("Helvetica", 8)
+    fonts.set(c, "Helvetica", 8)
     c.setFillColor(MED_GRAY)
     
-    for i, label in enumerate(labels):
-        tick_x = start_x + i * segment_width
-        c.line(tick_x, y - 5, tick_x, y + 5)
-        
-        label_width = c.stringWidth(label, "Helvetica", 8)
-        c.drawString(tick_x - label_width/2, y - 16, label)
-    
-    c.setStrokeColor(LIGHT_GRAY)
-    c.setLineWidth(0.5)
-    minor_ticks = 3
-    for i in range(num_labels - 1):
-        for j in range(1, minor_ticks + 1):
-            tick_x = start_x + i * segment_width + j * (segment_width / (minor_ticks + 1))
-            c.line(tick_x, y - 3, tick_x, y + 3)
+    label_widths = _get_label_widths()
+    strings = []
+    for tick, label in zip(major_ticks, labels):
+        tick_x = start_x + tick * scale_width
+        label_width = label_widths.get(label)
+        if label_width is None:
+            label_width = label_widths[label] = pdfmetrics.stringWidth(label, "Helvetica", 8)
+        strings.append((tick_x - label_width/2, y - 16, label))
+    draw_strings(c, strings)
 
 
-def draw_faction_page(c, page_num):
+def draw_faction_page(c):
     """Draw a single faction tracking page."""
-    page_width = RM2_WIDTH
-    content_width = page_width - 2 * MARGIN
-    
+    fonts = _FontCache()
     y = RM2_HEIGHT - MARGIN
     
     # === HEADER SECTION ===
     header_height = 35
-    draw_decorative_frame(c, MARGIN, y, content_width, header_height)
+    draw_decorative_frame(c, MARGIN, y, CONTENT_WIDTH, header_height)
     
-    c.setFont("Helvetica-Bold", 14)
+    fonts.set(c, "Helvetica-Bold", 14)
     c.setFillColor(DARK_GRAY)
     c.drawString(MARGIN + 10, y - 15, "FACTION:")
     
     c.setStrokeColor(LIGHT_GRAY)
     c.setLineWidth(0.5)
     c.setDash([2, 2])
-    c.line(MARGIN + 75, y - 19, content_width - 100, y - 19)
+    c.line(MARGIN + 75, y - 19, CONTENT_WIDTH - 100, y - 19)
     
-    c.setFont("Helvetica", 9)
+    fonts.set(c, "Helvetica", 9)
     c.setFillColor(MED_GRAY)
-    c.drawString(content_width - 85, y - 15, "Alignment:")
-    c.line(content_width - 30, y - 19, content_width + MARGIN - 10, y - 19)
+    c.drawString(CONTENT_WIDTH - 85, y - 15, "Alignment:")
+    c.line(CONTENT_WIDTH - 30, y - 19, CONTENT_WIDTH + MARGIN - 10, y - 19)
     c.setDash([])
     
     y -= header_height + 15
     
     # === CORE IDENTITY SECTION ===
-    y = draw_section_header(c, MARGIN, y, content_width, "Core Identity")
+    y = draw_section_header(c, MARGIN, y, CONTENT_WIDTH, "Core Identity", fonts=fonts)
     y -= 5
     
+    c.setDash([2, 2])
     draw_field_with_label(c, MARGIN + 5, y, "Leader/Key Figure:", 
-                          MARGIN + 100, content_width + MARGIN - 5)
+                          MARGIN + 100, CONTENT_WIDTH + MARGIN - 5, fonts=fonts)
     y -= 18
     
     draw_field_with_label(c, MARGIN + 5, y, "Primary Location:", 
-                          MARGIN + 95, content_width + MARGIN - 5)
+                          MARGIN + 95, CONTENT_WIDTH + MARGIN - 5, fonts=fonts)
+    c.setDash([])
     y -= 18
     
-    c.setFont("Helvetica", 9)
+    fonts.set(c, "Helvetica", 9)
     c.setFillColor(MED_GRAY)
     c.drawString(MARGIN + 5, y, "Goal (What They Want):")
     y -= 12
-    y = draw_ruled_lines(c, MARGIN + 10, y, content_width - 15, 4)
+    y = draw_ruled_lines(c, MARGIN + 10, y, CONTENT_WIDTH - 15, 4)
     
     y -= 8
-    c.setFont("Helvetica", 9)
+    fonts.set(c, "Helvetica", 9)
     c.setFillColor(MED_GRAY)
     c.drawString(MARGIN + 5, y, "Resources:")
     y -= 15
     
-    # Resource trackers - 2x2 grid layout
-    box_size = 10
-    box_spacing = 3
-    label_width_max = 55
-    col_width = (content_width - 10) / 2
-    
-    # Row 1: Troops (left) and Magic (right)
-    c.setFont("Helvetica", 8)
-    c.setFillColor(MED_GRAY)
-    c.drawString(MARGIN + 10, y, "Troops:")
-    box_start_x = MARGIN + label_width_max
-    for j in range(5):
-        c.setStrokeColor(MED_GRAY)
-        c.setLineWidth(0.75)
-        c.rect(box_start_x + j * (box_size + box_spacing), y - 2, box_size, box_size)
-    
-    c.setFillColor(MED_GRAY)
-    c.drawString(MARGIN + col_width + 10, y, "Magic:")
-    box_start_x_right = MARGIN + col_width + label_width_max - 5
-    for j in range(5):
-        c.setStrokeColor(MED_GRAY)
-        c.setLineWidth(0.75)
-        c.rect(box_start_x_right + j * (box_size + box_spacing), y - 2, box_size, box_size)
+    # Resource trackers - 2x2 grid layout, with all 20 boxes collected into
+    # one path and stroked together
+    boxes = c.beginPath()
     
-    y -= 16
+    labels = []
+    for row in RESOURCE_ROWS:
+        for label, (label_x, box_start_x) in zip(row, RESOURCE_COLUMNS):
+            labels.append((label_x, y, label))
+            for j in range(5):
+                boxes.rect(box_start_x + j * (BOX_SIZE + BOX_SPACING), y - 2, BOX_SIZE, BOX_SIZE)
+        y -= 16
     
-    # Row 2: Money (left) and Influence (right)
-    c.setFont("Helvetica", 8)
+    fonts.set(c, "Helvetica", 8)
     c.setFillColor(MED_GRAY)
-    c.drawString(MARGIN + 10, y, "Money:")
-    box_start_x = MARGIN + label_width_max
-    for j in range(5):
-        c.setStrokeColor(MED_GRAY)
-        c.setLineWidth(0.75)
-        c.rect(box_start_x + j * (box_size + box_spacing), y - 2, box_size, box_size)
+    draw_strings(c, labels)
     
-    c.setFillColor(MED_GRAY)
-    c.drawString(MARGIN + col_width + 10, y, "Influence:")
-    box_start_x_right = MARGIN + col_width + label_width_max - 5
-    for j in range(5):
-        c.setStrokeColor(MED_GRAY)
-        c.setLineWidth(0.75)
-        c.rect(box_start_x_right + j * (box_size + box_spacing), y - 2, box_size, box_size)
-    
-    y -= 16
+    c.setStrokeColor(MED_GRAY)
+    c.setLineWidth(0.75)
+    c.drawPath(boxes, stroke=1, fill=0)
     
     y -= 5
-    c.setFont("Helvetica", 8)
+    fonts.set(c, "Helvetica", 8)
     c.setFillColor(LIGHT_GRAY)
     c.drawString(MARGIN + 10, y, "Notes:")
     y -= 10
-    y = draw_ruled_lines(c, MARGIN + 10, y, content_width - 15, 3)
+    y = draw_ruled_lines(c, MARGIN + 10, y, CONTENT_WIDTH - 15, 3)
     
     y -= 10
     
     # === CURRENT ACTIVITY SECTION ===
-    y = draw_section_header(c, MARGIN, y, content_width, "Current Activity")
+    y = draw_section_header(c, MARGIN, y, CONTENT_WIDTH, "Current Activity", fonts=fonts)
     y -= 5
     
     frame_height = 65
-    draw_decorative_frame(c, MARGIN, y, content_width, frame_height)
+    draw_decorative_frame(c, MARGIN, y, CONTENT_WIDTH, frame_height)
     
-    c.setFont("Helvetica", 9)
+    fonts.set(c, "Helvetica", 9)
     c.setFillColor(MED_GRAY)
     c.drawString(MARGIN + 8, y - 12, "Current Plan/Front:")
-    y_inner = draw_ruled_lines(c, MARGIN + 10, y - 22, content_width - 20, 3)
+    y_inner = draw_ruled_lines(c, MARGIN + 10, y - 22, CONTENT_WIDTH - 20, 3)
     
     y -= frame_height + 12
     
-    c.setFont("Helvetica", 9)
+    fonts.set(c, "Helvetica", 9)
     c.setFillColor(MED_GRAY)
     c.drawString(MARGIN + 5, y, "Progress Clock:")
     y -= 22
-    draw_progress_clock(c, MARGIN, y, content_width)
+    draw_labeled_scale(c, MARGIN, y, CONTENT_WIDTH, PROGRESS_LABELS, fonts=fonts)
     
     y -= 38
     
     # === NOTES SECTION (Page 1) ===
-    y = draw_section_header(c, MARGIN, y, content_width, "Notes")
+    y = draw_section_header(c, MARGIN, y, CONTENT_WIDTH, "Notes", fonts=fonts)
     y -= 5
     
-    draw_ruled_lines(c, MARGIN + 5, y, content_width - 10, 5)
+    draw_ruled_lines(c, MARGIN + 5, y, CONTENT_WIDTH - 10, 5)
 
 
 def draw_faction_page_2(c):
     """Draw the second page of faction tracking (Relationships and Intelligence)."""
-    page_width = RM2_WIDTH
-    content_width = page_width - 2 * MARGIN
-    
+    fonts = _FontCache()
     y = RM2_HEIGHT - MARGIN
     
     # === RELATIONSHIPS SECTION ===
-    y = draw_section_header(c, MARGIN, y, content_width, "Relationships")
+    y = draw_section_header(c, MARGIN, y, CONTENT_WIDTH, "Relationships", fonts=fonts)
     y -= 5
     
-    c.setFont("Helvetica", 9)
+    fonts.set(c, "Helvetica", 9)
     c.setFillColor(MED_GRAY)
     c.drawString(MARGIN + 5, y, "Disposition Toward PCs:")
     y -= 25
-    draw_disposition_scale(c, MARGIN, y, content_width)
+    draw_labeled_scale(c, MARGIN, y, CONTENT_WIDTH, DISPOSITION_LABELS, fonts=fonts)
     
     y -= 35
     
-    c.setFont("Helvetica", 9)
+    fonts.set(c, "Helvetica", 9)
     c.setFillColor(MED_GRAY)
     c.drawString(MARGIN + 5, y, "Connections to Other Factions:")
     y -= 15
     
-    col_width = (content_width - 20) / 2
+    fonts.set(c, "Helvetica", 8)
+    c.setFillColor(LIGHT_GRAY)
+    c.setStrokeColor(LIGHT_GRAY)
+    c.setLineWidth(0.5)
+    labels = []
+    underlines = []
     for i in range(4):
-        c.setFont("Helvetica", 8)
-        c.setFillColor(LIGHT_GRAY)
-        c.drawString(MARGIN + 10, y, "Faction:")
-        c.drawString(MARGIN + col_width + 10, y, "Relationship:")
+        labels.append((MARGIN + 10, y, "Faction:"))
+        labels.append((MARGIN + RELATION_COL_WIDTH + 10, y, "Relationship:"))
         
-        c.setStrokeColor(LIGHT_GRAY)
-        c.setLineWidth(0.5)
-        c.setDash([2, 2])
-        c.line(MARGIN + 50, y - 3, MARGIN + col_width, y - 3)
-        c.line(MARGIN + col_width + 70, y - 3, content_width + MARGIN - 5, y - 3)
-        c.setDash([])
+        underlines.append((MARGIN + 50, y - 3, MARGIN + RELATION_COL_WIDTH, y - 3))
+        underlines.append((MARGIN + RELATION_COL_WIDTH + 70, y - 3, CONTENT_WIDTH + MARGIN - 5, y - 3))
         y -= 14
     
+    draw_strings(c, labels)
+    c.setDash([2, 2])
+    c.lines(underlines)
+    c.setDash([])
+    
     y -= 15
     
     # === INTELLIGENCE SECTION ===
-    y = draw_section_header(c, MARGIN, y, content_width, "Intelligence")
+    y = draw_section_header(c, MARGIN, y, CONTENT_WIDTH, "Intelligence", fonts=fonts)
     y -= 5
     
-    c.setFont("Helvetica", 9)
+    fonts.set(c, "Helvetica", 9)
     c.setFillColor(MED_GRAY)
     c.drawString(MARGIN + 5, y, "Known Agents/NPCs:")
     y -= 15
     
+    fonts.set(c, "Helvetica", 8)
+    c.setFillColor(LIGHT_GRAY)
+    c.setStrokeColor(LIGHT_GRAY)
+    c.setLineWidth(0.5)
+    labels = []
+    underlines = []
     for i in range(5):
-        c.setFont("Helvetica", 8)
-        c.setFillColor(LIGHT_GRAY)
-        c.drawString(MARGIN + 10, y, "Name:")
-        c.drawString(MARGIN + col_width - 20, y, "Role:")
+        labels.append((MARGIN + 10, y, "Name:"))
+        labels.append((MARGIN + RELATION_COL_WIDTH - 20, y, "Role:"))
         
-        c.setStrokeColor(LIGHT_GRAY)
-        c.setLineWidth(0.5)
-        c.setDash([2, 2])
-        c.line(MARGIN + 45, y - 3, MARGIN + col_width - 30, y - 3)
-        c.line(MARGIN + col_width + 5, y - 3, content_width + MARGIN - 5, y - 3)
-        c.setDash([])
+        underlines.append((MARGIN + 45, y - 3, MARGIN + RELATION_COL_WIDTH - 30, y - 3))
+        underlines.append((MARGIN + RELATION_COL_WIDTH + 5, y - 3, CONTENT_WIDTH + MARGIN - 5, y - 3))
         y -= 14
     
+    draw_strings(c, labels)
+    c.setDash([2, 2])
+    c.lines(underlines)
+    c.setDash([])
+    
     y -= 10
     
     # Strengths and Weaknesses - 2 columns
-    col_width_half = (content_width - 15) / 2
-    
-    c.setFont("Helvetica", 9)
+    fonts.set(c, "Helvetica", 9)
     c.setFillColor(MED_GRAY)
-    c.drawString(MARGIN + 5, y, "Strengths:")
-    c.drawString(MARGIN + col_width_half + 15, y, "Weaknesses:")
+    draw_strings(c, [(MARGIN + 5, y, "Strengths:"),
+                     (MARGIN + HALF_COL_WIDTH + 15, y, "Weaknesses:")])
     y -= 12
     
     # Draw 5 lines for each column
+    lines = []
     for i in range(5):
-        c.setStrokeColor(LIGHT_GRAY)
-        c.setLineWidth(0.5)
-        c.setDash([2, 2])
         # Left column (Strengths)
-        c.line(MARGIN + 10, y, MARGIN + col_width_half, y)
+        lines.append((MARGIN + 10, y, MARGIN + HALF_COL_WIDTH, y))
         # Right column (Weaknesses)
-        c.line(MARGIN + col_width_half + 15, y, content_width + MARGIN - 5, y)
-        c.setDash([])
+        lines.append((MARGIN + HALF_COL_WIDTH + 15, y, CONTENT_WIDTH + MARGIN - 5, y))
         y -= SMALL_LINE_HEIGHT
     
+    c.setStrokeColor(LIGHT_GRAY)
+    c.setLineWidth(0.5)
+    c.setDash([2, 2])
+    c.lines(lines)
+    c.setDash([])
+    
     y -= 10
     
     # === NOTES (Page 2) ===
-    y = draw_section_header(c, MARGIN, y, content_width, "Notes")
+    y = draw_section_header(c, MARGIN, y, CONTENT_WIDTH, "Notes", fonts=fonts)
     y -= 5
     
     remaining_lines = int((y - MARGIN - 10) / SMALL_LINE_HEIGHT)
-    draw_ruled_lines(c, MARGIN + 5, y, content_width - 10, remaining_lines)
+    draw_ruled_lines(c, MARGIN + 5, y, CONTENT_WIDTH - 10, remaining_lines)
 
 
-def create_faction_template(filename="faction_tracking_template.pdf"):
-    """Generate the faction tracking template (2 pages for 1 faction)."""
-    c = canvas.Canvas(filename, pagesize=(RM2_WIDTH, RM2_HEIGHT))
+def _build_page_forms(c):
+    """Record both faction pages as forms so each faction only has to stamp them."""
+    if c.hasForm("factionPage1"):
+        return
+    
+    c.beginForm("factionPage1")
+    draw_faction_page(c)
+    c.endForm()
     
-    draw_faction_page(c, 1)
-    c.showPage()
+    c.beginForm("factionPage2")
     draw_faction_page_2(c)
+    c.endForm()
+
+
+def _draw_faction(c, stamp):
+    """Add the 2 tracking pages for one faction to the canvas.
+    
+    With stamp, the pages are stamped from shared forms, which only pays off
+    when several factions go into the same PDF.
+    """
+    if stamp:
+        _build_page_forms(c)
+        c.doForm("factionPage1")
+        c.showPage()
+        c.doForm("factionPage2")
+        c.showPage()
+    else:
+        draw_faction_page(c)
+        c.showPage()
+        draw_faction_page_2(c)
+        c.showPage()
+
+
+def _pack_pdf(data):
+    """Repack PDF bytes into compressed object streams when pikepdf is available."""
+    if pikepdf is None:
+        return data
+    
+    out = io.BytesIO()
+    with pikepdf.open(io.BytesIO(data)) as pdf:
+        pdf.save(out, compress_streams=True,
+                 object_stream_mode=pikepdf.ObjectStreamMode.generate)
+    return out.getvalue()
+
+
+@lru_cache(maxsize=None)
+def _render_factions(num_factions):
+    """Render the template for a number of factions and return the PDF bytes.
+    
+    Nothing on the pages varies between runs, so the result is cached and
+    later calls only pay for writing the bytes out.
+    """
+    c = canvas.Canvas(io.BytesIO(), pagesize=(RM2_WIDTH, RM2_HEIGHT), pageCompression=1)
+    for i in range(num_factions):
+        _draw_faction(c, stamp=num_factions > 1)
+    
+    return _pack_pdf(c.getpdfdata())
+
+
+def _write_template(filename, num_factions):
+    """Write the template for a number of factions to filename."""
+    # Render before opening, so a failure leaves any existing file intact
+    data = _render_factions(num_factions)
+    with open(filename, "wb") as f:
+        f.write(data)
     
-    c.save()
     print(f"Created: {filename}")
     print(f"Page size: {RM2_WIDTH:.1f} x {RM2_HEIGHT:.1f} points")
-    print(f"Pages: 2 (1 faction)")
+    if num_factions == 1:
+        print(f"Pages: 2 (1 faction)")
+    else:
+        print(f"Pages: {2 * num_factions} ({num_factions} factions)")
     print(f"Optimized for reMarkable 2 (1404 x 1872 pixels)")
 
 
+def create_faction_template(filename="faction_tracking_template.pdf"):
+    """Generate the faction tracking template (2 pages for 1 faction)."""
+    _write_template(filename, 1)
+
+
+def create_faction_templates(num_factions, combined=True,
+                             filename="faction_tracking_templates.pdf"):
+    """Generate templates for several factions.
+    
+    When combined, every faction goes into a single PDF at filename;
+    otherwise each faction gets its own file, numbered after filename
+    (faction_tracking_templates_1.pdf, ...).
+    """
+    if num_factions < 1:
+        raise ValueError(f"num_factions must be at least 1, got {num_factions}")
+    
+    if combined:
+        _write_template(filename, num_factions)
+    else:
+        stem, ext = os.path.splitext(filename)
+        create_faction_template_files(
+            [f"{stem}_{i + 1}{ext}" for i in range(num_factions)])
+
+
+def create_faction_template_files(filenames):
+    """Write a separate faction template to each filename, all from one render."""
+    for name in filenames:
+        _write_template(name, 1)
+
+
 if __name__ == "__main__":
-    create_faction_template()
+    parser = argparse.ArgumentParser(
+        description="Build the faction tracking template PDF. The PDF is "
+                    "committed to the repo, so this is only needed after "
+                    "changing the layout.")
+    parser.add_argument("filename", nargs="?", default="faction_tracking_template.pdf")
+    args = parser.parse_args()
+    
+    create_faction_template(args.filename)
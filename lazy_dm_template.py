@@ -4,12 +4,16 @@ Lazy DM Session Prep Template for reMarkable 2
 Based on Sly Flourish's "Return of the Lazy Dungeon Master" method
 """
 
-from reportlab.lib.units import mm
-from reportlab.lib.colors import Color, black, white
+import argparse
+import cProfile
+import io
+import os
+import pstats
+from functools import lru_cache
+
+from reportlab.lib.colors import Color, black
 from reportlab.pdfgen import canvas
 from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.lib.pagesizes import letter
 
 # reMarkable 2 native resolution: 1404 x 1872 pixels at 226 DPI
 # Converting to points (72 DPI): 
@@ -27,40 +31,107 @@ LINE_HEIGHT = 14
 SMALL_LINE_HEIGHT = 12
 NAV_HEIGHT = 25
 HEADER_HEIGHT = 18
+NAV_Y = RM2_HEIGHT - MARGIN - 15  # Baseline of the nav bar labels
+
+# Ruled rows that fill the bottom of the fixed page layouts
+_STORY_BEATS_LINES = 8
+_LOOT_ROWS = 9
+_NOTES_LINES = 40
 
 # Page names for navigation
 PAGES = ["Overview", "Scenes", "Locations", "Secrets", "NPCs", "Combat", "Notes"]
 
+# Bookmark name for each page, shared by the pages and the nav links
+_DEST = tuple(f"page{i+1}" for i in range(len(PAGES)))
+_NO_BORDER = "[0 0 0]"
+
+# Nav label widths, so the labels can be centred without measuring per page
+_NAV_W_REG = {n: pdfmetrics.stringWidth(n, "Helvetica", 10) for n in PAGES}
+_NAV_W_BOLD = {n: pdfmetrics.stringWidth(n, "Helvetica-Bold", 10) for n in PAGES}
+
+
+@lru_cache(maxsize=None)
+def _nav_layout(page_width):
+    """Return (x, link_rect, page_name) for each nav link, computed once per width."""
+    y = NAV_Y
+    link_width = (page_width - 2 * MARGIN) / len(PAGES)
+    
+    layout = []
+    for i, page_name in enumerate(PAGES):
+        x = MARGIN + i * link_width + link_width / 2
+        link_rect = (x - link_width/2 + 5, y - 5, x + link_width/2 - 5, y + 12)
+        layout.append((x, link_rect, page_name))
+    return layout
+
+
+def _stroke_state(c):
+    """Return the stroke state _set_stroke has applied to the current page or form."""
+    state = c.__dict__.setdefault("_my_state", {})
+    if state.get("page") != c.getPageNumber():
+        # A new page starts from the PDF defaults
+        state.clear()
+        state.update(page=c.getPageNumber(), color=black, width=1, dash=())
+    return state
+
+
+def _begin_form(c, name, *bbox):
+    """Begin a form whose stroke state is whatever is in effect where it is drawn."""
+    c.beginForm(name, *bbox)
+    c.__dict__.setdefault("_my_state_stack", []).append(_stroke_state(c))
+    c._my_state = {"page": c.getPageNumber()}
+
+
+def _end_form(c):
+    """End a form begun with _begin_form and restore the page's stroke state."""
+    c.endForm()
+    c._my_state = c._my_state_stack.pop()
+
+
+def _set_stroke(c, color, width, dash=()):
+    """Set the stroke color, width and dash, skipping any already in effect.
+    
+    Only changes made through here are tracked, so never call setStrokeColor,
+    setLineWidth or setDash directly. Changes made between saveState and
+    restoreState would also go stale, so keep those pairs to stamping forms.
+    """
+    state = _stroke_state(c)
+    if state.get("color") != color:
+        c.setStrokeColor(color)
+        state["color"] = color
+    if state.get("width") != width:
+        c.setLineWidth(width)
+        state["width"] = width
+    if state.get("dash") != dash:
+        c.setDash(list(dash))
+        state["dash"] = dash
+
 
 def draw_nav_bar(c, page_width, current_page_idx):
     """Draw navigation bar at top of page with links."""
-    y = RM2_HEIGHT - MARGIN - 15
+    y = NAV_Y
     
     # Draw decorative bar background
-    c.setStrokeColor(MED_GRAY)
-    c.setLineWidth(1)
-    c.line(MARGIN, y - 8, page_width - MARGIN, y - 8)
-    c.line(MARGIN, y + 12, page_width - MARGIN, y + 12)
+    _set_stroke(c, MED_GRAY, 1)
+    c.lines([(MARGIN, y - 8, page_width - MARGIN, y - 8),
+             (MARGIN, y + 12, page_width - MARGIN, y + 12)])
     
-    # Calculate link positions
-    link_width = (page_width - 2 * MARGIN) / len(PAGES)
+    # Only the highlighted label and the links differ from page to page
+    layout = _nav_layout(page_width)
     
-    for i, page_name in enumerate(PAGES):
-        x = MARGIN + i * link_width + link_width / 2
-        
-        # Highlight current page
-        if i == current_page_idx:
-            c.setFillColor(DARK_GRAY)
-            c.setFont("Helvetica-Bold", 10)
-        else:
-            c.setFillColor(MED_GRAY)
-            c.setFont("Helvetica", 10)
-        
-        c.drawCentredString(x, y, page_name)
+    c.setFillColor(MED_GRAY)
+    c.setFont("Helvetica", 10)
+    for i, (x, link_rect, page_name) in enumerate(layout):
+        if i != current_page_idx:
+            c.drawString(x - _NAV_W_REG[page_name] * 0.5, y, page_name)
         
         # Create clickable link area
-        link_rect = (x - link_width/2 + 5, y - 5, x + link_width/2 - 5, y + 12)
-        c.linkRect("", f"page{i+1}", link_rect, Border="[0 0 0]")
+        c.linkRect("", _DEST[i], link_rect, Border=_NO_BORDER)
+    
+    # Highlight current page
+    x, _, page_name = layout[current_page_idx]
+    c.setFillColor(DARK_GRAY)
+    c.setFont("Helvetica-Bold", 10)
+    c.drawString(x - _NAV_W_BOLD[page_name] * 0.5, y, page_name)
     
     return y - 20  # Return Y position below nav bar
 
@@ -72,8 +143,7 @@ def draw_section_header(c, x, y, width, title, icon=None):
     c.drawString(x + 12, y, title)  # Moved right to avoid corner flourish
     
     # Decorative line under header
-    c.setStrokeColor(MED_GRAY)
-    c.setLineWidth(1.5)
+    _set_stroke(c, MED_GRAY, 1.5)
     c.line(x, y - 5, x + width, y - 5)
     
     # Corner flourishes
@@ -85,53 +155,42 @@ def draw_section_header(c, x, y, width, title, icon=None):
 
 def draw_corner_flourish(c, x, y, position):
     """Draw a small Celtic-style corner flourish."""
-    c.setStrokeColor(MED_GRAY)
-    c.setLineWidth(0.75)
     size = 8
+    _set_stroke(c, MED_GRAY, 0.75)
     
     if position == "tl":
-        c.line(x, y, x + size, y)
-        c.line(x, y, x, y - size)
+        c.lines([(x, y, x + size, y), (x, y, x, y - size)])
         c.arc(x, y - size, x + size, y, 90, 90)
     elif position == "tr":
-        c.line(x, y, x - size, y)
-        c.line(x, y, x, y - size)
+        c.lines([(x, y, x - size, y), (x, y, x, y - size)])
         c.arc(x - size, y - size, x, y, 0, 90)
     elif position == "bl":
-        c.line(x, y, x + size, y)
-        c.line(x, y, x, y + size)
+        c.lines([(x, y, x + size, y), (x, y, x, y + size)])
         c.arc(x, y, x + size, y + size, 180, 90)
     elif position == "br":
-        c.line(x, y, x - size, y)
-        c.line(x, y, x, y + size)
+        c.lines([(x, y, x - size, y), (x, y, x, y + size)])
         c.arc(x - size, y, x, y + size, 270, 90)
 
 
-def draw_ruled_lines(c, x, y, width, num_lines, line_height=SMALL_LINE_HEIGHT):
-    """Draw light gray ruled lines for writing."""
-    c.setStrokeColor(LIGHT_GRAY)
-    c.setLineWidth(0.5)
-    c.setDash([2, 2])  # Dotted line
+def draw_ruled_lines(c, x, y, width, num_lines, line_height=SMALL_LINE_HEIGHT, segments=None):
+    """Draw light gray ruled lines for writing.
     
-    for i in range(num_lines):
-        line_y = y - (i * line_height)
-        c.line(x, line_y, x + width, line_y)
-    
-    c.setDash([])  # Reset to solid
+    If segments is given the lines are appended to it instead, so a page can
+    stroke all of its dotted lines with one dash change.
+    """
+    lines = [(x, line_y, x + width, line_y)
+             for line_y in (y - i * line_height for i in range(num_lines))]
+    if segments is None:
+        _set_stroke(c, LIGHT_GRAY, 0.5, (2, 2))  # Dotted line
+        c.lines(lines)
+    else:
+        segments.extend(lines)
     return y - (num_lines * line_height)
 
 
-def draw_checkbox(c, x, y, size=8):
-    """Draw a checkbox square."""
-    c.setStrokeColor(MED_GRAY)
-    c.setLineWidth(0.75)
-    c.rect(x, y - size + 2, size, size)
-
-
 def draw_decorative_frame(c, x, y, width, height, style="parchment"):
     """Draw a decorative frame around a section."""
-    c.setStrokeColor(MED_GRAY)
-    c.setLineWidth(1)
+    _set_stroke(c, MED_GRAY, 1)
     
     # Main rectangle
     c.rect(x, y - height, width, height)
@@ -144,21 +203,21 @@ def draw_decorative_frame(c, x, y, width, height, style="parchment"):
 
 
 def draw_sword_divider(c, x, y, width):
-    """Draw a decorative sword divider."""
-    c.setStrokeColor(MED_GRAY)
-    c.setLineWidth(0.75)
+    """Draw a decorative sword divider. Not used by any page at present."""
+    _set_stroke(c, MED_GRAY, 0.75)
     
     mid = x + width / 2
     
-    # Main line
-    c.line(x + 20, y, mid - 15, y)
-    c.line(mid + 15, y, x + width - 20, y)
-    
-    # Sword shape in middle
-    c.line(mid - 12, y, mid + 12, y)  # Blade
-    c.line(mid - 3, y - 3, mid - 3, y + 3)  # Guard
-    c.line(mid + 3, y - 3, mid + 3, y + 3)  # Guard
-    c.circle(mid, y, 2, fill=0)  # Pommel hint
+    c.lines([
+        # Main line
+        (x + 20, y, mid - 15, y),
+        (mid + 15, y, x + width - 20, y),
+        # Sword shape in middle
+        (mid - 12, y, mid + 12, y),  # Blade
+        (mid - 3, y - 3, mid - 3, y + 3),  # Guard
+        (mid + 3, y - 3, mid + 3, y + 3),  # Guard
+    ])
+    c.rect(mid - 1, y - 1, 2, 2, stroke=1, fill=0)  # Pommel hint
 
 
 # ============ PAGE 1: OVERVIEW ============
@@ -169,7 +228,7 @@ def draw_page1_overview(c):
     content_width = page_width - 2 * MARGIN
     
     # Add bookmark/destination for navigation
-    c.bookmarkPage("page1")
+    c.bookmarkPage(_DEST[0])
     
     # Navigation bar
     y = draw_nav_bar(c, page_width, 0)
@@ -183,22 +242,24 @@ def draw_page1_overview(c):
     c.setFillColor(DARK_GRAY)
     c.drawString(MARGIN + 10, y - 12, "Campaign:")
     
-    # Underline for campaign
-    c.setStrokeColor(LIGHT_GRAY)
-    c.setLineWidth(0.5)
-    c.line(MARGIN + 70, y - 16, content_width + MARGIN - 10, y - 16)
-    
     # Session # and Date on second row, smaller
     c.setFont("Helvetica-Bold", 10)
     c.drawString(MARGIN + 10, y - 35, "Session #")
     c.drawString(MARGIN + 150, y - 35, "Date:")
     
-    # Underlines for session and date
-    c.line(MARGIN + 65, y - 39, MARGIN + 130, y - 39)
-    c.line(MARGIN + 180, y - 39, MARGIN + 280, y - 39)
+    # Underlines for campaign, session and date
+    _set_stroke(c, LIGHT_GRAY, 0.5)
+    c.lines([
+        (MARGIN + 70, y - 16, content_width + MARGIN - 10, y - 16),
+        (MARGIN + 65, y - 39, MARGIN + 130, y - 39),
+        (MARGIN + 180, y - 39, MARGIN + 280, y - 39),
+    ])
     
     y -= 60
     
+    # Dotted lines are collected and stroked together at the end of the page
+    dotted = []
+    
     # === TWO COLUMN SECTION: Characters (left) and Session Recap (right) ===
     col_width = (content_width - 10) / 2
     section_start_y = y
@@ -208,11 +269,11 @@ def draw_page1_overview(c):
     y -= 5
     
     # 4 character slots (removed PC 5)
+    c.setFont("Helvetica", 9)
+    c.setFillColor(MED_GRAY)
     for i in range(4):
-        c.setFont("Helvetica", 9)
-        c.setFillColor(MED_GRAY)
         c.drawString(MARGIN + 5, y, f"PC {i+1}:")
-        y = draw_ruled_lines(c, MARGIN + 35, y, col_width - 35, 2)
+        y = draw_ruled_lines(c, MARGIN + 35, y, col_width - 35, 2, segments=dotted)
         y -= 5
     
     left_col_end_y = y
@@ -224,7 +285,7 @@ def draw_page1_overview(c):
     y -= 5
     
     # Ruled lines for recap
-    y = draw_ruled_lines(c, right_col_x + 5, y, col_width - 10, 9)
+    y = draw_ruled_lines(c, right_col_x + 5, y, col_width - 10, 9, segments=dotted)
     
     # Use the lower of the two columns
     y = min(left_col_end_y, y)
@@ -237,7 +298,7 @@ def draw_page1_overview(c):
     
     frame_height = 140
     draw_decorative_frame(c, MARGIN, y, content_width, frame_height)
-    y = draw_ruled_lines(c, MARGIN + 10, y - 15, content_width - 20, 10)
+    y = draw_ruled_lines(c, MARGIN + 10, y - 15, content_width - 20, 10, segments=dotted)
     
     y -= 20
     
@@ -245,29 +306,24 @@ def draw_page1_overview(c):
     y = draw_section_header(c, MARGIN, y, content_width, "Story Beats")
     y -= 5
     
-    # Calculate remaining space and fill with 3 columns
-    remaining_height = y - MARGIN - 10
-    num_lines = int(remaining_height / SMALL_LINE_HEIGHT)
+    # Fill the remaining space with 3 columns
+    num_lines = _STORY_BEATS_LINES
+    assert num_lines == int((y - MARGIN - 10) / SMALL_LINE_HEIGHT), "page 1 layout changed"
     
     col3_width = (content_width - 20) / 3
     
-    for i in range(num_lines):
-        c.setStrokeColor(LIGHT_GRAY)
-        c.setLineWidth(0.5)
-        c.setDash([2, 2])
-        
-        # Left column
-        c.line(MARGIN + 5, y, MARGIN + col3_width - 5, y)
-        
-        # Middle column
-        c.line(MARGIN + col3_width + 10, y, MARGIN + 2 * col3_width + 5, y)
-        
-        # Right column
-        c.line(MARGIN + 2 * col3_width + 15, y, MARGIN + content_width - 5, y)
-        
-        y -= SMALL_LINE_HEIGHT
+    # Left, middle and right column extents
+    columns = (
+        (MARGIN + 5, MARGIN + col3_width - 5),
+        (MARGIN + col3_width + 10, MARGIN + 2 * col3_width + 5),
+        (MARGIN + 2 * col3_width + 15, MARGIN + content_width - 5),
+    )
+    
+    ys = [y - i * SMALL_LINE_HEIGHT for i in range(num_lines)]
+    dotted += [(x1, line_y, x2, line_y) for line_y in ys for x1, x2 in columns]
     
-    c.setDash([])
+    _set_stroke(c, LIGHT_GRAY, 0.5, (2, 2))
+    c.lines(dotted)
 
 
 # ============ PAGE 2: SCENES ============
@@ -277,7 +333,7 @@ def draw_page2_scenes(c):
     page_width = RM2_WIDTH
     content_width = page_width - 2 * MARGIN
     
-    c.bookmarkPage("page2")
+    c.bookmarkPage(_DEST[1])
     y = draw_nav_bar(c, page_width, 1)
     
     # === POTENTIAL SCENES ===
@@ -285,16 +341,21 @@ def draw_page2_scenes(c):
     y = draw_section_header(c, MARGIN, y, content_width, "Potential Scenes")
     y -= 5
     
-    # 7 scene blocks to fill the page
+    # 7 scene blocks to fill the page; the dotted lines are stroked together
+    dotted = []
+    c.setFont("Helvetica-Bold", 9)
+    c.setFillColor(MED_GRAY)
     for i in range(7):
-        c.setFont("Helvetica-Bold", 9)
-        c.setFillColor(MED_GRAY)
         c.drawString(MARGIN + 5, y, f"Scene {i+1}:")
-        c.setStrokeColor(LIGHT_GRAY)
+        # The first underline keeps the header flourish's heavier width
+        _set_stroke(c, LIGHT_GRAY, 0.75 if i == 0 else 0.5)
         c.line(MARGIN + 50, y - 3, content_width + MARGIN, y - 3)
         y -= 15  # Space before first dotted line
-        y = draw_ruled_lines(c, MARGIN + 10, y, content_width - 10, 4)
+        y = draw_ruled_lines(c, MARGIN + 10, y, content_width - 10, 4, segments=dotted)
         y -= 8
+    
+    _set_stroke(c, LIGHT_GRAY, 0.5, (2, 2))
+    c.lines(dotted)
 
 
 # ============ PAGE 3: LOCATIONS ============
@@ -304,7 +365,7 @@ def draw_page3_locations(c):
     page_width = RM2_WIDTH
     content_width = page_width - 2 * MARGIN
     
-    c.bookmarkPage("page3")
+    c.bookmarkPage(_DEST[2])
     y = draw_nav_bar(c, page_width, 2)
     
     # === FANTASTIC LOCATIONS ===
@@ -312,20 +373,31 @@ def draw_page3_locations(c):
     y = draw_section_header(c, MARGIN, y, content_width, "Fantastic Locations")
     y -= 5
     
-    # 8 location blocks to fill the page
+    # 8 location blocks to fill the page; the Features labels are drawn
+    # afterwards so each font is only set once, and the dotted lines are
+    # stroked together
+    features_ys = []
+    dotted = []
+    c.setFont("Helvetica-Bold", 9)
+    c.setFillColor(MED_GRAY)
     for i in range(8):
-        c.setFont("Helvetica-Bold", 9)
-        c.setFillColor(MED_GRAY)
         c.drawString(MARGIN + 5, y, f"Location {i+1}:")
-        c.setStrokeColor(LIGHT_GRAY)
+        # The first underline keeps the header flourish's heavier width
+        _set_stroke(c, LIGHT_GRAY, 0.75 if i == 0 else 0.5)
         c.line(MARGIN + 65, y - 3, content_width + MARGIN, y - 3)
         y -= 15  # Space before Features
         
-        c.setFont("Helvetica", 8)
-        c.setFillColor(LIGHT_GRAY)
-        c.drawString(MARGIN + 10, y, "Features:")
-        y = draw_ruled_lines(c, MARGIN + 55, y, content_width - 55, 3)
+        features_ys.append(y)
+        y = draw_ruled_lines(c, MARGIN + 55, y, content_width - 55, 3, segments=dotted)
         y -= 8
+    
+    _set_stroke(c, LIGHT_GRAY, 0.5, (2, 2))
+    c.lines(dotted)
+    
+    c.setFont("Helvetica", 8)
+    c.setFillColor(LIGHT_GRAY)
+    for features_y in features_ys:
+        c.drawString(MARGIN + 10, features_y, "Features:")
 
 
 # ============ PAGE 4: SECRETS & LOOT ============
@@ -335,7 +407,7 @@ def draw_page4_secrets(c):
     page_width = RM2_WIDTH
     content_width = page_width - 2 * MARGIN
     
-    c.bookmarkPage("page4")
+    c.bookmarkPage(_DEST[3])
     y = draw_nav_bar(c, page_width, 3)
     
     # === SECRETS AND CLUES ===
@@ -343,15 +415,23 @@ def draw_page4_secrets(c):
     y = draw_section_header(c, MARGIN, y, content_width, "Secrets and Clues")
     y -= 5
     
-    # 10 secrets with checkboxes
+    # Dotted lines are collected and stroked together at the end of the page
+    dotted = []
+    
+    # 10 secrets with checkboxes, all collected into one path and stroked
+    # together
+    boxes = c.beginPath()
+    c.setFont("Helvetica", 9)
+    c.setFillColor(MED_GRAY)
     for i in range(10):
-        draw_checkbox(c, MARGIN + 5, y)
-        c.setFont("Helvetica", 9)
-        c.setFillColor(MED_GRAY)
+        boxes.rect(MARGIN + 5, y - 6, 8, 8)
         c.drawString(MARGIN + 18, y - 6, f"{i+1}.")
-        y = draw_ruled_lines(c, MARGIN + 30, y - 6, content_width - 30, 2)
+        y = draw_ruled_lines(c, MARGIN + 30, y - 6, content_width - 30, 2, segments=dotted)
         y -= 5
     
+    _set_stroke(c, MED_GRAY, 0.75)
+    c.drawPath(boxes, stroke=1, fill=0)
+    
     y -= 5
     
     # === LOOT & REWARDS (2 columns, fill remainder of page) ===
@@ -359,24 +439,21 @@ def draw_page4_secrets(c):
     y -= 5
     
     col_width = (content_width - 10) / 2
-    remaining_height = y - MARGIN - 10
-    num_rows = int(remaining_height / SMALL_LINE_HEIGHT) + 1
+    num_rows = _LOOT_ROWS
+    assert num_rows == int((y - MARGIN - 10) / SMALL_LINE_HEIGHT) + 1, "page 4 layout changed"
     
     # Draw lines for both columns
-    for i in range(num_rows):
-        c.setStrokeColor(LIGHT_GRAY)
-        c.setLineWidth(0.5)
-        c.setDash([2, 2])
-        
-        # Left column
-        c.line(MARGIN + 5, y, MARGIN + col_width - 5, y)
-        
-        # Right column
-        c.line(MARGIN + col_width + 15, y, MARGIN + content_width - 5, y)
-        
-        y -= SMALL_LINE_HEIGHT
+    # Left and right column extents
+    columns = (
+        (MARGIN + 5, MARGIN + col_width - 5),
+        (MARGIN + col_width + 15, MARGIN + content_width - 5),
+    )
+    
+    ys = [y - i * SMALL_LINE_HEIGHT for i in range(num_rows)]
+    dotted += [(x1, line_y, x2, line_y) for line_y in ys for x1, x2 in columns]
     
-    c.setDash([])
+    _set_stroke(c, LIGHT_GRAY, 0.5, (2, 2))
+    c.lines(dotted)
 
 
 # ============ PAGE 5: NPCs ============
@@ -386,7 +463,7 @@ def draw_page5_npcs(c):
     page_width = RM2_WIDTH
     content_width = page_width - 2 * MARGIN
     
-    c.bookmarkPage("page5")
+    c.bookmarkPage(_DEST[4])
     y = draw_nav_bar(c, page_width, 4)
     
     # === IMPORTANT NPCs ===
@@ -394,98 +471,123 @@ def draw_page5_npcs(c):
     y = draw_section_header(c, MARGIN, y, content_width, "Important NPCs")
     y -= 5
     
-    # 4 NPC blocks with Notes field (reduced from 5 to fit with Notes)
+    # 4 NPC blocks with Notes field (reduced from 5 to fit with Notes); the
+    # bold Name labels are drawn afterwards so each font is only set once, and
+    # the dotted field lines are stroked together
+    name_ys = []
+    dotted = []
+    c.setFont("Helvetica", 8)
+    c.setFillColor(MED_GRAY)
     for i in range(4):
         # NPC frame - taller to fit all fields including Notes
         frame_height = 105
         draw_decorative_frame(c, MARGIN, y, content_width, frame_height)
         
         inner_y = y - 14
-        c.setFont("Helvetica-Bold", 9)
-        c.setFillColor(MED_GRAY)
-        c.drawString(MARGIN + 8, inner_y, "Name:")
-        c.setStrokeColor(LIGHT_GRAY)
-        c.setLineWidth(0.5)
-        c.setDash([2, 2])
-        c.line(MARGIN + 40, inner_y - 3, MARGIN + 200, inner_y - 3)
+        name_ys.append(inner_y)
+        dotted.append((MARGIN + 40, inner_y - 3, MARGIN + 200, inner_y - 3))
         
         # Faction field on same line as name
-        c.setFont("Helvetica", 8)
-        c.setFillColor(MED_GRAY)
         c.drawString(MARGIN + 210, inner_y, "Faction:")
-        c.setStrokeColor(LIGHT_GRAY)
-        c.line(MARGIN + 250, inner_y - 3, content_width + MARGIN - 10, inner_y - 3)
+        dotted.append((MARGIN + 250, inner_y - 3, content_width + MARGIN - 10, inner_y - 3))
         
         inner_y -= 16
         c.drawString(MARGIN + 8, inner_y, "Appearance:")
-        c.line(MARGIN + 60, inner_y - 3, content_width + MARGIN - 10, inner_y - 3)
+        dotted.append((MARGIN + 60, inner_y - 3, content_width + MARGIN - 10, inner_y - 3))
         
         inner_y -= 16
         c.drawString(MARGIN + 8, inner_y, "Motivation:")
-        c.line(MARGIN + 55, inner_y - 3, content_width + MARGIN - 10, inner_y - 3)
+        dotted.append((MARGIN + 55, inner_y - 3, content_width + MARGIN - 10, inner_y - 3))
         
         inner_y -= 16
         c.drawString(MARGIN + 8, inner_y, "Voice/Quirk:")
-        c.line(MARGIN + 58, inner_y - 3, content_width + MARGIN - 10, inner_y - 3)
+        dotted.append((MARGIN + 58, inner_y - 3, content_width + MARGIN - 10, inner_y - 3))
         
         inner_y -= 16
         c.drawString(MARGIN + 8, inner_y, "Notes:")
-        c.line(MARGIN + 40, inner_y - 3, content_width + MARGIN - 10, inner_y - 3)
+        dotted.append((MARGIN + 40, inner_y - 3, content_width + MARGIN - 10, inner_y - 3))
         # Second notes line
         inner_y -= 12
-        c.line(MARGIN + 10, inner_y - 3, content_width + MARGIN - 10, inner_y - 3)
+        dotted.append((MARGIN + 10, inner_y - 3, content_width + MARGIN - 10, inner_y - 3))
         
-        c.setDash([])
         y -= frame_height + 12
+    
+    _set_stroke(c, LIGHT_GRAY, 0.5, (2, 2))
+    c.lines(dotted)
+    
+    c.setFont("Helvetica-Bold", 9)
+    for name_y in name_ys:
+        c.drawString(MARGIN + 8, name_y, "Name:")
 
 
 # ============ PAGE 6: COMBAT ============
 
-def draw_initiative_tracker(c, x, y, width, height, tracker_num):
-    """Draw a single initiative tracker box."""
-    draw_decorative_frame(c, x, y, width, height)
+def _build_tracker_form(c, name, width, height):
+    """Record an initiative tracker, minus its encounter label, as a form.
     
-    inner_y = y - 12
-    c.setFont("Helvetica-Bold", 9)
-    c.setFillColor(MED_GRAY)
-    c.drawString(x + 5, inner_y, f"Encounter {tracker_num}:")
-    c.setStrokeColor(LIGHT_GRAY)
-    c.line(x + 70, inner_y - 3, x + width - 10, inner_y - 3)
+    The form's origin is the tracker's top-left corner.
+    """
+    _begin_form(c, name, -10, -height - 10, width + 10, 10)
+    draw_decorative_frame(c, 0, 0, width, height)
+    
+    inner_y = -12
+    _set_stroke(c, LIGHT_GRAY, 0.75)
+    c.line(70, inner_y - 3, width - 10, inner_y - 3)
     
     inner_y -= 18
     
     # Column headers
     c.setFont("Helvetica", 7)
     c.setFillColor(LIGHT_GRAY)
-    c.drawString(x + 5, inner_y, "Init")
-    c.drawString(x + 30, inner_y, "Name")
-    c.drawString(x + width - 70, inner_y, "HP")
-    c.drawString(x + width - 30, inner_y, "Notes")
+    c.drawString(5, inner_y, "Init")
+    c.drawString(30, inner_y, "Name")
+    c.drawString(width - 70, inner_y, "HP")
+    c.drawString(width - 30, inner_y, "Notes")
     
     inner_y -= 10
     
-    # 12 rows for combatants (increased from 8)
+    # 12 rows for combatants (increased from 8), stroked as one path
+    p = c.beginPath()
+    rect, move_to, line_to = p.rect, p.moveTo, p.lineTo
     for i in range(12):
-        c.setStrokeColor(LIGHT_GRAY)
-        c.setLineWidth(0.5)
-        c.setDash([1, 2])
-        
         # Init box
-        c.rect(x + 5, inner_y - 10, 18, 12)
+        rect(5, inner_y - 10, 18, 12)
         
         # Name line
-        c.line(x + 28, inner_y - 8, x + width - 75, inner_y - 8)
+        move_to(28, inner_y - 8)
+        line_to(width - 75, inner_y - 8)
         
         # HP boxes (5 small boxes)
         for j in range(5):
-            c.rect(x + width - 70 + (j * 10), inner_y - 10, 8, 10)
+            rect(width - 70 + (j * 10), inner_y - 10, 8, 10)
         
         # Notes line
-        c.line(x + width - 18, inner_y - 8, x + width - 5, inner_y - 8)
+        move_to(width - 18, inner_y - 8)
+        line_to(width - 5, inner_y - 8)
         
         inner_y -= 12
     
-    c.setDash([])
+    _set_stroke(c, LIGHT_GRAY, 0.5, (1, 2))
+    c.drawPath(p, stroke=1, fill=0)
+    
+    _end_form(c)
+
+
+def draw_initiative_tracker(c, x, y, width, height, tracker_num):
+    """Draw a single initiative tracker box."""
+    # Every tracker of a given size is identical apart from its label
+    name = f"tracker_{width:.2f}x{height:.2f}"
+    if not c.hasForm(name):
+        _build_tracker_form(c, name, width, height)
+    
+    c.saveState()
+    c.translate(x, y)
+    c.doForm(name)
+    c.restoreState()
+    
+    c.setFont("Helvetica-Bold", 9)
+    c.setFillColor(MED_GRAY)
+    c.drawString(x + 5, y - 12, f"Encounter {tracker_num}:")
 
 
 def draw_page6_combat(c):
@@ -493,7 +595,7 @@ def draw_page6_combat(c):
     page_width = RM2_WIDTH
     content_width = page_width - 2 * MARGIN
     
-    c.bookmarkPage("page6")
+    c.bookmarkPage(_DEST[5])
     y = draw_nav_bar(c, page_width, 5)
     
     # === INITIATIVE TRACKERS (2x2) ===
@@ -533,22 +635,19 @@ def draw_page6_combat(c):
     y -= 14
     
     # Draw lines for both columns (4 rows each)
+    _set_stroke(c, LIGHT_GRAY, 0.5, (2, 2))
+    rows = []
     for i in range(4):
-        c.setStrokeColor(LIGHT_GRAY)
-        c.setLineWidth(0.5)
-        c.setDash([2, 2])
-        
-        # Left column
-        c.line(MARGIN + 5, y, MARGIN + col_width - 50, y)
-        c.line(MARGIN + col_width - 45, y, MARGIN + col_width - 5, y)
-        
-        # Right column
-        c.line(MARGIN + col_width + 15, y, MARGIN + content_width - 45, y)
-        c.line(MARGIN + content_width - 40, y, MARGIN + content_width - 5, y)
-        
+        rows += [
+            # Left column
+            (MARGIN + 5, y, MARGIN + col_width - 50, y),
+            (MARGIN + col_width - 45, y, MARGIN + col_width - 5, y),
+            # Right column
+            (MARGIN + col_width + 15, y, MARGIN + content_width - 45, y),
+            (MARGIN + content_width - 40, y, MARGIN + content_width - 5, y),
+        ]
         y -= 12
-    
-    c.setDash([])
+    c.lines(rows)
 
 
 # ============ PAGE 7: SESSION NOTES ============
@@ -558,7 +657,7 @@ def draw_page7_notes(c):
     page_width = RM2_WIDTH
     content_width = page_width - 2 * MARGIN
     
-    c.bookmarkPage("page7")
+    c.bookmarkPage(_DEST[6])
     y = draw_nav_bar(c, page_width, 6)
     
     # === SESSION NOTES ===
@@ -567,51 +666,57 @@ def draw_page7_notes(c):
     y -= 5
     
     # Fill the rest of the page with ruled lines
-    remaining_height = y - MARGIN - 10
-    num_lines = int(remaining_height / SMALL_LINE_HEIGHT)
+    num_lines = _NOTES_LINES
+    assert num_lines == int((y - MARGIN - 10) / SMALL_LINE_HEIGHT), "page 7 layout changed"
     
     draw_ruled_lines(c, MARGIN + 5, y, content_width - 10, num_lines)
 
 
 # ============ MAIN ============
 
+PAGES_DRAW = (draw_page1_overview, draw_page2_scenes, draw_page3_locations,
+              draw_page4_secrets, draw_page5_npcs, draw_page6_combat, draw_page7_notes)
+
+
+def _draw_pages(c, profile=False):
+    """Draw all seven pages onto one canvas, optionally profiling each page."""
+    for i, draw_page in enumerate(PAGES_DRAW):
+        if i:
+            c.showPage()
+        if profile:
+            with cProfile.Profile() as pr:
+                draw_page(c)
+            print(f"--- Page {i+1}: {PAGES[i]} ---")
+            pstats.Stats(pr).sort_stats("cumulative").print_stats(10)
+        else:
+            draw_page(c)
+
+
 def create_lazy_dm_template(filename="lazy_dm_session_template.pdf"):
     """Generate the complete Lazy DM session prep template."""
-    c = canvas.Canvas(filename, pagesize=(RM2_WIDTH, RM2_HEIGHT))
-    
-    # Page 1: Overview
-    draw_page1_overview(c)
-    c.showPage()
-    
-    # Page 2: Scenes
-    draw_page2_scenes(c)
-    c.showPage()
-    
-    # Page 3: Locations
-    draw_page3_locations(c)
-    c.showPage()
-    
-    # Page 4: Secrets & Loot
-    draw_page4_secrets(c)
-    c.showPage()
-    
-    # Page 5: NPCs
-    draw_page5_npcs(c)
-    c.showPage()
-    
-    # Page 6: Combat
-    draw_page6_combat(c)
-    c.showPage()
+    # All pages share one canvas: the nav links target bookmarks on other
+    # pages, and the nav, flourish and tracker forms are stored only once
+    c = canvas.Canvas(io.BytesIO(), pagesize=(RM2_WIDTH, RM2_HEIGHT), pageCompression=1, invariant=0)
+    # Set LAZY_DM_PROFILE=1 to print a cProfile summary for each page
+    _draw_pages(c, profile=bool(os.environ.get("LAZY_DM_PROFILE")))
     
-    # Page 7: Session Notes
-    draw_page7_notes(c)
+    # Render before opening, so a failure leaves any existing file intact
+    data = c.getpdfdata()
+    with open(filename, "wb") as f:
+        f.write(data)
     
-    c.save()
     print(f"Created: {filename}")
     print(f"Page size: {RM2_WIDTH:.1f} x {RM2_HEIGHT:.1f} points")
-    print(f"Pages: 7")
+    print(f"Pages: {len(PAGES_DRAW)}")
     print(f"Optimized for reMarkable 2 (1404 x 1872 pixels)")
 
 
 if __name__ == "__main__":
-    create_lazy_dm_template()
+    parser = argparse.ArgumentParser(
+        description="Build the Lazy DM session prep template PDF. The PDF is "
+                    "committed to the repo, so this is only needed after "
+                    "changing the layout.")
+    parser.add_argument("filename", nargs="?", default="lazy_dm_session_template.pdf")
+    args = parser.parse_args()
+    
+    create_lazy_dm_template(args.filename)